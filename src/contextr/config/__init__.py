@@ -4,14 +4,15 @@ Configuration module for contextr
 
 from .languages import LANGUAGE_MAPPINGS, get_language_for_extension
 from .settings import (
-    CHUNK_SIZE,
+    BINARY_EXTENSIONS,
+    BINARY_SNIFF_SIZE,
     DEFAULT_CONFIG_FILE,
     DEFAULT_PATHS,
     DEFAULT_RECENT,
     DEFAULT_RECENT_DAYS,
     MAX_FILE_SIZE,
+    PARALLEL_THRESHOLD,
     SKIP_DIRS,
-    TEXT_ENCODINGS,
 )
 from .toml_loader import ContextrConfig, get_effective_config
 
@@ -23,9 +24,10 @@ __all__ = [
     "DEFAULT_RECENT",
     "DEFAULT_RECENT_DAYS",
     "SKIP_DIRS",
-    "TEXT_ENCODINGS",
     "MAX_FILE_SIZE",
-    "CHUNK_SIZE",
+    "BINARY_SNIFF_SIZE",
+    "BINARY_EXTENSIONS",
+    "PARALLEL_THRESHOLD",
     "LANGUAGE_MAPPINGS",
     "get_language_for_extension",
 ]
@@ -12,7 +12,37 @@ DEFAULT_RECENT_DAYS = 7
 
 # File processing settings
 MAX_FILE_SIZE = 16 * 1024
-CHUNK_SIZE = 8192
+BINARY_SNIFF_SIZE = 512  # Leading bytes inspected for binary detection
+
+# Below this many files, thread pool start-up costs more than it saves
+PARALLEL_THRESHOLD = 8
+
+# File extensions (without the dot, lowercase) known to hold binary data;
+# files with these are treated as binary without being read
+BINARY_EXTENSIONS = frozenset(
+    {
+        "png",
+        "jpg",
+        "jpeg",
+        "gif",
+        "bmp",
+        "ico",  # Images
+        "pdf",  # Documents
+        "zip",
+        "tar",
+        "gz",
+        "jar",  # Archives
+        "exe",
+        "dll",
+        "so",
+        "dylib",
+        "o",
+        "a",
+        "bin",  # Native binaries
+        "pyc",
+        "class",  # Bytecode
+    }
+)
 
 # Skip directories
 SKIP_DIRS = {
@@ -38,6 +68,3 @@ SKIP_DIRS = {
     ".DS_Store",
     "Thumbs.db",  # OS files
 }
-
-# Text encodings to try
-TEXT_ENCODINGS = ["utf-8", "utf-16", "utf-16-le", "utf-16-be", "latin-1", "cp1252"]
@@ -4,14 +4,10 @@ TOML configuration file loading and processing
 
 import tomllib
 from pathlib import Path
-
-import typer
-from rich.console import Console
+from typing import NoReturn
 
 from .settings import DEFAULT_CONFIG_FILE, DEFAULT_PATHS
 
-console = Console()
-
 
 class ContextrConfig:
     """Configuration class for contextr"""
@@ -64,15 +60,9 @@ class ContextrConfig:
             )
 
         except tomllib.TOMLDecodeError as e:
-            console.print(
-                f"Invalid TOML syntax in {config_path}: {e}", style="bold red"
-            )
-            raise typer.Exit(1) from e
+            _exit_with_error(f"Invalid TOML syntax in {config_path}: {e}", e)
         except Exception as e:
-            console.print(
-                f"Error reading config file {config_path}: {e}", style="bold red"
-            )
-            raise typer.Exit(1) from e
+            _exit_with_error(f"Error reading config file {config_path}: {e}", e)
 
     def merge_with_cli(
         self,
@@ -101,6 +91,24 @@ class ContextrConfig:
         )
 
 
+def _exit_with_error(message: str, error: Exception) -> NoReturn:
+    """
+    Report a configuration error and exit the CLI.
+
+    typer and rich are imported here rather than at module level, so that
+    importing the config package (and everything built on it) stays cheap.
+
+    Args:
+        message: Error message to display
+        error: Exception that caused the failure
+    """
+    import typer
+    from rich.console import Console
+
+    Console().print(message, style="bold red")
+    raise typer.Exit(1) from error
+
+
 def get_effective_config(
     cli_paths: list[str] | None = None,
     cli_include: str | None = None,
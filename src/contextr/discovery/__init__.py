@@ -2,6 +2,11 @@
 File and directory discovery functionality.
 """
 
-from .file_discovery import discover_files, should_include_file, should_skip_path
+from .file_discovery import (
+    discover_files,
+    scan_files,
+    should_include_file,
+    should_skip_path,
+)
 
-__all__ = ["discover_files", "should_include_file", "should_skip_path"]
+__all__ = ["discover_files", "scan_files", "should_include_file", "should_skip_path"]
@@ -3,7 +3,9 @@ File and directory discovery functionality.
 """
 
 import fnmatch
+import os
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 from ..config import SKIP_DIRS
@@ -27,14 +29,13 @@ def discover_files(paths: list[Path], include_pattern: str | None = None) -> lis
             if should_include_file(path, include_pattern):
                 files.append(path)
         elif path.is_dir():
+            # A skipped directory given directly skips everything beneath it
+            if should_skip_path(path):
+                continue
             # find files in directory
             try:
-                for file_path in path.rglob("*"):
-                    if file_path.is_file() and should_include_file(
-                        file_path, include_pattern
-                    ):
-                        if should_skip_path(file_path):
-                            continue
+                for file_path in scan_files(path):
+                    if should_include_file(file_path, include_pattern):
                         files.append(file_path)
             except PermissionError:
                 print(f"Permission denied accessing directory: {path}", file=sys.stderr)
@@ -43,6 +44,45 @@ def discover_files(paths: list[Path], include_pattern: str | None = None) -> lis
     return files
 
 
+def scan_files(root: Path) -> Iterator[Path]:
+    """
+    Recursively yield the files under a directory using os.scandir().
+
+    Entries named in SKIP_DIRS are pruned without being descended into, and
+    symlinked directories are not followed. The file type comes from the
+    directory listing itself, so most entries need no extra stat() call.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        Path of each file found
+
+    Raises:
+        PermissionError: If root itself cannot be read; unreadable
+            subdirectories are skipped
+    """
+    stack = [os.fspath(root)]
+    is_root = True
+
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name in SKIP_DIRS:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            # Unreadable (or vanished) subdirectories are skipped
+            if is_root:
+                raise
+        is_root = False
+
+
 def should_include_file(file_path: Path, include_pattern: str | None = None) -> bool:
     """Check if a file should be included based on the pattern."""
     if include_pattern:
@@ -6,9 +6,9 @@ import sys
 from pathlib import Path
 
 from ..config import get_language_for_extension
-from ..git import get_file_git_timestamp
+from ..git import get_file_git_timestamps
 from ..output import generate_tree_structure
-from ..processing import is_binary_file, read_file_content
+from ..processing import count_lines, is_binary_file, read_file_content
 from ..statistics import FileStatistics
 
 
@@ -263,6 +263,14 @@ class RepositoryReportFormatter:
         total_lines = 0
         processed_files = 0
 
+        # Look up all git timestamps in one batch rather than one git call per file.
+        # Timestamps are optional, so a failure here must not abort the report
+        try:
+            git_timestamps = get_file_git_timestamps(files_list, git_repo_root)
+        except Exception as e:
+            print(f"Error getting git timestamps: {e}", file=sys.stderr)
+            git_timestamps = {}
+
         for file_path in sorted(files_list):
             try:
                 # Skip binary files
@@ -285,7 +293,7 @@ class RepositoryReportFormatter:
                 file_extension = file_path.suffix.lstrip(".")
 
                 # Get git timestamp for the file
-                git_timestamp = get_file_git_timestamp(file_path, git_repo_root)
+                git_timestamp = git_timestamps.get(file_path)
                 timestamp_str = f" (Modified: {git_timestamp})" if git_timestamp else ""
 
                 # Determine language for syntax highlighting
@@ -296,7 +304,7 @@ class RepositoryReportFormatter:
                 output_parts.append(content)
                 output_parts.append("```\n")
 
-                total_lines += len(content.splitlines())
+                total_lines += count_lines(content)
                 processed_files += 1
 
             except Exception as e:
@@ -5,6 +5,7 @@ Git repository functionality.
 from .git_operations import (
     find_git_root,
     get_file_git_timestamp,
+    get_file_git_timestamps,
     get_git_info,
     get_recent_git_files,
 )
@@ -14,4 +15,5 @@ __all__ = [
     "get_git_info",
     "get_recent_git_files",
     "get_file_git_timestamp",
+    "get_file_git_timestamps",
 ]
@@ -2,9 +2,57 @@
 Git repository operations and information extraction.
 """
 
+import os
 import subprocess
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import IO
+
+from ..config import PARALLEL_THRESHOLD
+
+# Length of the "YYYY-MM-DD HH:MM:SS" that starts a %ci date (it is fixed-width)
+_TIMESTAMP_LENGTH = len("2024-01-15 14:30:22")
+
+# Characters of pathspecs passed to a single git call, well below the command
+# line limits (about 32K characters on Windows)
+_PATHSPEC_BATCH_CHARS = 16 * 1024
+
+# Run git commands to completion, or start them for streaming; tests swap
+# these attributes to fake git output
+_run_git = subprocess.run
+_popen_git = subprocess.Popen
+
+# Bytes read from a streamed git process at a time
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Stat calls block on I/O rather than the GIL, so many can overlap
+_MAX_STAT_WORKERS = 32
+
+
+def _run_git_command(git_root: Path, cmd: list[str]) -> str:
+    """
+    Run a git command in the repository and return its stripped output.
+
+    Args:
+        git_root: Repository directory to run the command in
+        cmd: Git arguments (without the leading "git")
+
+    Returns:
+        Command output, or an empty string if git failed or is not installed
+    """
+    try:
+        result = _run_git(
+            ["git"] + cmd,
+            cwd=git_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return ""
 
 
 def find_git_root(start_path: Path) -> Path | None:
@@ -43,28 +91,17 @@ def get_git_info(repo_path: Path) -> dict[str, str] | None:
         if git_root is None:
             return None
 
-        # Use git commands to get information
-        def run_git_command(cmd: list[str]) -> str:
-            try:
-                result = subprocess.run(
-                    ["git"] + cmd,
-                    cwd=git_root,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                return result.stdout.strip()
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                return ""
-
-        commit = run_git_command(["rev-parse", "HEAD"])
-        branch = run_git_command(["rev-parse", "--abbrev-ref", "HEAD"])
-        author = run_git_command(["log", "-1", "--pretty=format:%an <%ae>"])
-        date = run_git_command(["log", "-1", "--pretty=format:%cd"])
+        # Commit, author and date come from a single log call, one field per line
+        head_output = _run_git_command(
+            git_root, ["log", "-1", "--pretty=format:%H%n%an <%ae>%n%cd"]
+        )
+        commit, author, date = (head_output.split("\n") + ["", ""])[:3]
 
         if not commit:  # No commits yet
             return None
 
+        branch = _run_git_command(git_root, ["rev-parse", "--abbrev-ref", "HEAD"])
+
         return {
             "commit": commit,
             "branch": branch or "HEAD",
@@ -77,6 +114,29 @@ def get_git_info(repo_path: Path) -> dict[str, str] | None:
         return None
 
 
+def _split_nul_stream(stream: IO[bytes] | None) -> Iterator[bytes]:
+    """
+    Split a byte stream into NUL-terminated records, reading it in chunks.
+
+    Args:
+        stream: Binary stream to read, such as a subprocess pipe
+
+    Yields:
+        Each record without its terminating NUL
+    """
+    if stream is None:
+        return
+
+    pending = b""
+    while chunk := stream.read(_STREAM_CHUNK_SIZE):
+        records = (pending + chunk).split(b"\0")
+        pending = records.pop()  # Incomplete until its NUL arrives
+        yield from records
+
+    if pending:
+        yield pending
+
+
 def get_recent_git_files(repo_path: Path, days: int = 7) -> list[Path]:
     """
     Get files that have been modified in git commits within the last N days.
@@ -96,58 +156,217 @@ def get_recent_git_files(repo_path: Path, days: int = 7) -> list[Path]:
         # Get commits from the last N days
         since_date = f"{days}.days.ago"
 
-        def run_git_command(cmd: list[str]) -> str:
-            try:
-                result = subprocess.run(
-                    ["git"] + cmd,
-                    cwd=git_root,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                return result.stdout.strip()
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                return ""
-
         # Get files changed in commits from the last N days
-        # Using --name-only to get just the file names, --since to limit by date
-        changed_files_output = run_git_command(
-            ["log", f"--since={since_date}", "--name-only", "--pretty=format:", "--"]
-        )
-
-        if not changed_files_output:
+        # Using --name-only to get just the file names, --since to limit by date.
+        # -z separates names with NULs and never quotes them, so any file name
+        # (even one containing a newline) comes through verbatim.
+        # Output is streamed and consumed in chunks instead of being buffered.
+        try:
+            process = _popen_git(
+                [
+                    "git",
+                    "log",
+                    "-z",
+                    f"--since={since_date}",
+                    "--name-only",
+                    "--pretty=format:",
+                    "--",
+                ],
+                cwd=git_root,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError:
             return []
 
-        # Parse the output and convert to absolute paths
-        recent_files = []
-        file_lines = [
-            line.strip() for line in changed_files_output.split("\n") if line.strip()
-        ]
-
-        for file_line in file_lines:
-            file_path = git_root / file_line
-            if file_path.exists() and file_path.is_file():
-                recent_files.append(file_path)
+        # Deduplicate names before touching the filesystem, preserving order
+        candidates = []
+        seen: set[bytes] = set()
+        try:
+            for name in _split_nul_stream(process.stdout):
+                # Empty names are the separators between commits
+                if not name or name in seen:
+                    continue
+                seen.add(name)
+                candidates.append(git_root / os.fsdecode(name))
+        finally:
+            if process.stdout:
+                process.stdout.close()
+            returncode = process.wait()
+
+        if returncode != 0:
+            return []
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_files = []
-        for file_path in recent_files:
-            if file_path not in seen:
-                seen.add(file_path)
-                unique_files.append(file_path)
+        # is_file() is a single stat that is also False for missing paths.
+        # Stat calls are latency-bound (especially on network filesystems), so
+        # larger candidate lists are checked on a thread pool to overlap them
+        if len(candidates) < PARALLEL_THRESHOLD:
+            checks = [path.is_file() for path in candidates]
+        else:
+            workers = min(_MAX_STAT_WORKERS, len(candidates))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                checks = list(executor.map(Path.is_file, candidates))
 
-        return unique_files
+        return [path for path, exists in zip(candidates, checks, strict=True) if exists]
 
     except Exception as e:
         print(f"Error getting recent git files: {e}", file=sys.stderr)
         return []
 
 
+def get_file_git_timestamps(file_paths: list[Path], repo_root: Path) -> dict[Path, str]:
+    """
+    Get the last commit timestamp for many files with few git invocations.
+
+    The files are passed to `git log` as pathspecs, in batches that fit on a
+    command line, so git only reports the commits that touched them. Commits
+    come newest first, so the first timestamp seen for a file is its latest
+    one, and git is stopped as soon as every file of a batch has been seen.
+
+    The results match get_file_git_timestamp() for each file. Git simplifies
+    history for all pathspecs together, so past a merge that differs from
+    every parent the walk can reach side-branch changes that the merge
+    discarded for one of the files; files first seen there are looked up on
+    their own.
+
+    Args:
+        file_paths: Paths to the files
+        repo_root: Root path of the git repository
+
+    Returns:
+        Dictionary mapping each file with git history to its formatted timestamp
+    """
+    # Map git's (forward-slash, repo_root-relative) names back to the caller's paths
+    wanted: dict[str, Path] = {}
+    for file_path in file_paths:
+        try:
+            wanted[file_path.relative_to(repo_root).as_posix()] = file_path
+        except ValueError:
+            continue
+
+    timestamps: dict[Path, str] = {}
+    for batch in _pathspec_batches(list(wanted)):
+        timestamps.update(
+            _stream_timestamps(repo_root, {name: wanted[name] for name in batch})
+        )
+
+    return timestamps
+
+
+def _pathspec_batches(names: list[str]) -> Iterator[list[str]]:
+    """Split names into batches whose total length stays within the limit."""
+    batch: list[str] = []
+    length = 0
+    for name in names:
+        if batch and length + len(name) > _PATHSPEC_BATCH_CHARS:
+            yield batch
+            batch, length = [], 0
+        batch.append(name)
+        length += len(name) + 1  # Arguments are separated on the command line
+
+    if batch:
+        yield batch
+
+
+def _stream_timestamps(repo_root: Path, wanted: dict[str, Path]) -> dict[Path, str]:
+    """
+    Run one `git log` for the given files and collect their latest timestamps.
+
+    Args:
+        repo_root: Root path of the git repository
+        wanted: Repository-relative names mapped to the caller's paths; entries
+            are removed as they are found
+
+    Returns:
+        Dictionary mapping each file found in the history to its timestamp
+    """
+    # -z separates names with NULs and never quotes them, and names are
+    # decoded like the filesystem does, so no file name can break the parse.
+    # --literal-pathspecs stops names such as "*.py" from matching as globs.
+    try:
+        process = _popen_git(
+            [
+                "git",
+                "--literal-pathspecs",
+                "log",
+                "-z",
+                "--relative",
+                "--name-only",
+                "--pretty=format:%ci %P",
+                "--",
+                *wanted,
+            ],
+            cwd=repo_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        return {}
+
+    timestamps: dict[Path, str] = {}
+    current_timestamp = ""
+    at_header = True
+    # Files first seen after a merge, whose history may differ when simplified
+    # for the file alone
+    after_merge = False
+    recheck: list[Path] = []
+
+    try:
+        # Each commit is "<%ci> <parents>\n<name>\0<name>\0...\0" followed by
+        # an empty record; a commit listing no files (a merge) is just its
+        # header followed by a NUL
+        for record in _split_nul_stream(process.stdout):
+            if at_header:
+                header, has_names, record = record.partition(b"\n")
+                # Drop the timezone and parents: 2024-01-15 14:30:22 -0500 ...
+                current_timestamp = header[:_TIMESTAMP_LENGTH].decode(
+                    "ascii", "replace"
+                )
+                # Date, time and timezone, then one field per parent
+                if len(header.split()) > 4:
+                    after_merge = True
+                if not has_names:
+                    continue
+                at_header = False
+            elif not record:  # End of this commit's names
+                at_header = True
+                continue
+
+            try:
+                name = os.fsdecode(record)
+            except UnicodeDecodeError:
+                continue  # Cannot be one of the requested paths
+
+            file_path = wanted.pop(name, None)
+            if file_path is not None:
+                if after_merge:
+                    recheck.append(file_path)
+                else:
+                    timestamps[file_path] = current_timestamp
+                if not wanted:
+                    break  # Every requested file has been found
+    finally:
+        if process.stdout:
+            process.stdout.close()
+        if process.poll() is None:
+            process.kill()  # Stopped early; the rest of the history is not needed
+        process.wait()
+
+    # Before the first merge the walk is linear and agrees with per-file logs
+    for file_path in recheck:
+        timestamp = get_file_git_timestamp(file_path, repo_root)
+        if timestamp:
+            timestamps[file_path] = timestamp
+
+    return timestamps
+
+
 def get_file_git_timestamp(file_path: Path, repo_root: Path) -> str | None:
     """
     Get the last commit timestamp for a specific file from git.
 
+    Prefer get_file_git_timestamps() when looking up more than one file.
+
     Args:
         file_path: Path to the file
         repo_root: Root path of the git repository
@@ -159,23 +378,24 @@ def get_file_git_timestamp(file_path: Path, repo_root: Path) -> str | None:
         relative_path = file_path.relative_to(repo_root)
 
         # Get the last commit date for this specific file
-        result = subprocess.run(
-            ["git", "log", "-1", "--pretty=format:%ci", "--", str(relative_path)],
+        result = _run_git(
+            [
+                "git",
+                "--literal-pathspecs",
+                "log",
+                "-1",
+                "--pretty=format:%ci",
+                "--",
+                relative_path.as_posix(),
+            ],
             cwd=repo_root,
             capture_output=True,
             text=True,
             check=True,
         )
 
-        if result.stdout.strip():
-            # Parse the git timestamp and reformat it
-            # Git timestamp format: 2024-01-15 14:30:22 -0500
-            timestamp_str = result.stdout.strip()
-            # Take only the date and time part (remove timezone)
-            datetime_part = timestamp_str.split(" ")[0:2]
-            return " ".join(datetime_part)
-
-        return None
+        # Git timestamp format: 2024-01-15 14:30:22 -0500 (drop the timezone)
+        return result.stdout.strip()[:_TIMESTAMP_LENGTH] or None
 
     except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
         return None
@@ -5,6 +5,13 @@ Tree structure formatting functionality.
 from pathlib import Path
 from typing import Any
 
+# Tree-drawing glyphs: connectors precede an entry's name, and prefixes
+# continue the parent's column on the rows below it
+_CONNECT_MID = "├── "
+_CONNECT_LAST = "└── "
+_PREFIX_CONT = "│   "
+_PREFIX_BLANK = "    "
+
 
 def generate_tree_structure(files: list[Path], root: Path) -> str:
     """
@@ -17,44 +24,83 @@ def generate_tree_structure(files: list[Path], root: Path) -> str:
     Returns:
         String representation of the directory tree
     """
+    if not files:
+        return ""
+
     tree: dict[str, Any] = {}
 
+    # Matching leading parts is equivalent to relative_to(), but files
+    # outside the root are skipped without raising and catching ValueError
+    root_parts = root.parts
+    depth = len(root_parts)
+    root_is_absolute = root.is_absolute()
+
     for file_path in files:
-        try:
-            relative_path = file_path.relative_to(root)
-            parts = relative_path.parts
+        file_parts = file_path.parts
+        if file_parts[:depth] != root_parts:
+            continue
+        # An empty root (".") has no parts to tell absolute paths apart
+        if not depth and file_path.is_absolute() != root_is_absolute:
+            continue
 
-            current: dict[str, Any] = tree
-            for part in parts[:-1]:  # All except the file name
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
+        parts = file_parts[depth:]
+        if not parts:  # The root itself, not a file under it
+            continue
 
-            # Add the file
-            current[parts[-1]] = None
+        current: dict[str, Any] = tree
+        for part in parts[:-1]:  # All except the file name
+            if part not in current:
+                current[part] = {}
+            current = current[part]
 
-        except ValueError:
-            continue
+        # Add the file
+        current[parts[-1]] = None
 
     # Convert tree to string representation
     return _format_tree(tree, "", True)
 
 
 def _format_tree(tree: dict, prefix: str = "", is_last: bool = True) -> str:
-    """Recursively format the tree structure."""
+    """
+    Format the tree structure depth first.
+
+    Uses an explicit stack instead of recursion, so deeply nested trees cost
+    no extra call frames and cannot hit the recursion limit.
+    """
+    if not tree:
+        return ""
+
     lines = []
-    items = sorted(
-        tree.items(), key=lambda x: (x[1] is not None, x[0])
-    )  # Dirs first, then files
+    # Entries are (prefix, name, subtree, is_last_item); children are pushed
+    # in reverse so they pop off the stack in sorted order
+    stack: list[tuple[str, str, dict | None, bool]] = []
+    _push_children(stack, tree, prefix)
 
-    for i, (name, subtree) in enumerate(items):
-        is_last_item = i == len(items) - 1
+    while stack:
+        prefix, name, subtree, is_last_item = stack.pop()
+        connector = _CONNECT_LAST if is_last_item else _CONNECT_MID
 
         if subtree is None:  # It's a file
-            lines.append(f"{prefix}{'└── ' if is_last_item else '├── '}{name}")
+            lines.append(f"{prefix}{connector}{name}")
         else:  # It's a directory
-            lines.append(f"{prefix}{'└── ' if is_last_item else '├── '}{name}/")
-            extension = "    " if is_last_item else "│   "
-            lines.append(_format_tree(subtree, prefix + extension, is_last_item))
+            lines.append(f"{prefix}{connector}{name}/")
+            extension = _PREFIX_BLANK if is_last_item else _PREFIX_CONT
+            _push_children(stack, subtree, prefix + extension)
+
+    return "\n".join(lines)
+
+
+def _order_key(item: tuple[str, dict | None]) -> tuple[bool, str]:
+    """Sort key listing files (None subtrees) first, then directories, by name."""
+    return item[1] is not None, item[0]
+
 
-    return "\n".join(filter(None, lines))
+def _push_children(
+    stack: list[tuple[str, str, dict | None, bool]], tree: dict, prefix: str
+) -> None:
+    """Push a directory's children onto the stack so they pop in sorted order."""
+    items = sorted(tree.items(), key=_order_key)
+    last_index = len(items) - 1
+    for i in range(last_index, -1, -1):
+        name, subtree = items[i]
+        stack.append((prefix, name, subtree, i == last_index))
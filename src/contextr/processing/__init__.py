@@ -2,6 +2,18 @@
 File content processing functionality.
 """
 
-from .file_reader import format_file_size, is_binary_file, read_file_content
+from .file_reader import (
+    count_lines,
+    format_file_size,
+    is_binary_data,
+    is_binary_file,
+    read_file_content,
+)
 
-__all__ = ["read_file_content", "is_binary_file", "format_file_size"]
+__all__ = [
+    "read_file_content",
+    "is_binary_file",
+    "is_binary_data",
+    "count_lines",
+    "format_file_size",
+]
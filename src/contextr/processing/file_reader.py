@@ -2,16 +2,30 @@
 File content reading and processing functionality.
 """
 
+import codecs
+import os
 import sys
 from pathlib import Path
 
-from ..config import CHUNK_SIZE, MAX_FILE_SIZE, TEXT_ENCODINGS
+from ..config import BINARY_EXTENSIONS, BINARY_SNIFF_SIZE, MAX_FILE_SIZE
+
+# Bytes expected in text files: BEL, BS, TAB, LF, FF, CR, ESC and 0x20 upwards
+_TEXT_CHARS = bytes({7, 8, 9, 10, 12, 13, 27}) + bytes(range(0x20, 0x100))
+
+# Maximum share of non-text bytes a chunk may contain and still count as text
+_MAX_NONTEXT_RATIO = 0.30
+
+# Units used by format_file_size, indexed by power of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 
 def read_file_content(file_path: Path) -> str | None:
     """
     Read file content with proper handling of large files and encoding.
 
+    The file is read with a single readinto() call into a buffer sized from
+    fstat(), capped at MAX_FILE_SIZE, so large files are never fully loaded.
+
     Args:
         file_path: Path to the file
 
@@ -19,37 +33,26 @@ def read_file_content(file_path: Path) -> str | None:
         File content as string or None if cannot read
     """
     try:
-        file_size = file_path.stat().st_size
-
-        # Handle empty files
-        if file_size == 0:
-            return ""
-
-        # Try different encodings
-        content = None
-
-        for encoding in TEXT_ENCODINGS:
-            try:
-                if file_size > MAX_FILE_SIZE:
-                    # Read first part and add truncation notice
-                    with open(file_path, encoding=encoding, errors="ignore") as f:
-                        content = f.read(MAX_FILE_SIZE // 4)
-
-                    lines = content.splitlines()
-                    if len(lines) > 1:
-                        # Remove last potentially incomplete line
-                        lines = lines[:-1]
-
-                    content = "\n".join(lines)
-                    content += f"\n\n... [File truncated - showing first {format_file_size(MAX_FILE_SIZE)} of {format_file_size(file_size)}]"
-                    break
-                else:
-                    # Read entire file
-                    with open(file_path, encoding=encoding, errors="ignore") as f:
-                        content = f.read()
-                        break
-            except (UnicodeDecodeError, UnicodeError):
-                continue
+        with open(file_path, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+
+            # Handle empty files
+            if file_size == 0:
+                return ""
+
+            data = bytearray(min(file_size, MAX_FILE_SIZE))
+            bytes_read = f.readinto(data)
+            del data[bytes_read:]  # File may have shrunk since fstat()
+
+        content = _decode_text(data)
+
+        if file_size > MAX_FILE_SIZE:
+            # Remove last potentially incomplete line
+            last_newline = content.rfind("\n")
+            if last_newline != -1:
+                content = content[:last_newline]
+
+            content += f"\n\n... [File truncated - showing first {format_file_size(MAX_FILE_SIZE)} of {format_file_size(file_size)}]"
 
         return content
 
@@ -58,9 +61,43 @@ def read_file_content(file_path: Path) -> str | None:
         return None
 
 
+def count_lines(content: str) -> int:
+    """
+    Count the lines in text, including a final line without a trailing newline.
+
+    Uses a single C-level str.count() instead of materialising a list of lines.
+
+    Args:
+        content: Text content (with universal newlines)
+
+    Returns:
+        Number of lines
+    """
+    if not content:
+        return 0
+    return content.count("\n") + (not content.endswith("\n"))
+
+
+def _decode_text(data: bytes | bytearray) -> str:
+    """Decode raw file bytes as UTF-8 text with universal newlines."""
+    # Pure ASCII (most source files) can skip the UTF-8 decoder state machine
+    if data.isascii():
+        content = data.decode("ascii")
+    else:
+        content = data.decode("utf-8", errors="ignore")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
 def is_binary_file(file_path: Path) -> bool:
     """
-    Check if a file is binary by reading a small chunk and checking if it can be decoded as text.
+    Check if a file is binary by its extension or the bytes of its first chunk.
+
+    Files with a known binary extension (BINARY_EXTENSIONS) are binary without
+    being read, matching FileStatistics. Otherwise the file is opened and read
+    exactly once; there is no separate stat() probe, so a missing or unreadable
+    file surfaces as an OSError and counts as binary.
 
     Args:
         file_path: Path to the file
@@ -68,39 +105,53 @@ def is_binary_file(file_path: Path) -> bool:
     Returns:
         True if file appears to be binary
     """
+    if file_path.suffix[1:].lower() in BINARY_EXTENSIONS:
+        return True
+
     try:
         with open(file_path, "rb") as f:
-            chunk = f.read(CHUNK_SIZE)  # Read first chunk for binary detection
-
-            # If chunk is empty, it's likely not binary
-            if not chunk:
-                return False
-
-            # Check for common text encodings
-            for encoding in TEXT_ENCODINGS:
-                try:
-                    decoded = chunk.decode(encoding)
-                    # Additional check: if most characters are printable, it's likely text
-                    printable_chars = sum(
-                        1 for c in decoded if c.isprintable() or c.isspace()
-                    )
-                    if len(decoded) > 0 and printable_chars / len(decoded) > 0.95:
-                        return False  # Successfully decoded with mostly printable chars, likely text
-                except (UnicodeDecodeError, UnicodeError):
-                    continue
-
-            # If we couldn't decode with any text encoding, it's likely binary
-            return True
-
-    except Exception:
+            chunk = f.read(BINARY_SNIFF_SIZE)  # Read first chunk for binary detection
+    except OSError:
         return True  # If we can't read it, treat as binary
 
+    return is_binary_data(chunk)
+
+
+def is_binary_data(chunk: bytes | bytearray) -> bool:
+    """
+    Check if raw bytes from the start of a file look like binary content.
+
+    A chunk is treated as text when the share of control bytes (anything outside
+    the printable range and common whitespace) stays below a small threshold.
+
+    Args:
+        chunk: Leading bytes of a file (typically BINARY_SNIFF_SIZE bytes)
+
+    Returns:
+        True if the bytes appear to be binary
+    """
+    # If chunk is empty, it's likely not binary
+    if not chunk:
+        return False
+
+    # UTF-16 text is full of NUL bytes, but announces itself with a BOM
+    if chunk.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return False
+
+    # A NUL byte never shows up in 8-bit text; memchr finds it cheaply
+    if b"\x00" in chunk:
+        return True
+
+    # Strip all text bytes in one C-level pass; whatever is left is non-text
+    nontext = chunk.translate(None, _TEXT_CHARS)
+    return len(nontext) / len(chunk) > _MAX_NONTEXT_RATIO
+
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format."""
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    else:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
+
+    # Each unit is 2**10 times the previous one, so the bit length picks it
+    unit_index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit_index)):.1f} {_SIZE_UNITS[unit_index]}"
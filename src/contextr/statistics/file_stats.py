@@ -2,10 +2,106 @@
 File statistics calculation and analysis.
 """
 
+import os
+import threading
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from ..processing import is_binary_file, read_file_content
+from ..config import (
+    BINARY_EXTENSIONS,
+    BINARY_SNIFF_SIZE,
+    MAX_FILE_SIZE,
+    PARALLEL_THRESHOLD,
+)
+from ..processing import is_binary_data
+
+# Files can be given as paths or as os.scandir() entries, whose cached stat
+# result saves a syscall per file
+FileLike = Path | os.DirEntry[str]
+
+# Reads block on I/O rather than the GIL, so oversubscribe the CPUs
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Size of the per-thread read buffer reused by every _classify call; the
+# report never shows more of a file than this
+_SCRATCH_SIZE = MAX_FILE_SIZE
+
+_scratch = threading.local()
+
+
+def _scratch_buffer() -> bytearray:
+    """Get this thread's reusable read buffer, allocating it on first use."""
+    buffer: bytearray | None = getattr(_scratch, "buffer", None)
+    if buffer is None:
+        buffer = _scratch.buffer = bytearray(_SCRATCH_SIZE)
+    return buffer
+
+
+@lru_cache(maxsize=4096)
+def _classify(path_str: str, mtime_ns: int, size: int) -> tuple[bool, int]:
+    """
+    Classify a file as binary or text and count its lines in a single read.
+
+    Only the first MAX_FILE_SIZE bytes are read, and lines are counted exactly
+    as count_lines(read_file_content(...)) would count them, so the statistics
+    agree with the file contents shown in the report.
+
+    The modification time is not used directly; it is part of the cache key so
+    that a file changed on disk is classified again.
+
+    Args:
+        path_str: Path to the file as a string
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        Tuple of (is_binary, line_count); line_count is 0 for binary files
+    """
+    # Read into a reused buffer rather than allocating new bytes per file
+    buffer = _scratch_buffer()
+    with open(path_str, "rb") as f:
+        bytes_read = f.readinto(buffer)
+
+    # Look at the same leading bytes as is_binary_file so both agree
+    if is_binary_data(buffer[: min(bytes_read, BINARY_SNIFF_SIZE)]):
+        return True, 0
+    if not bytes_read:
+        return False, 0
+
+    # LF, CRLF and a bare CR each end one line, as after newline normalization
+    line_breaks = buffer.count(b"\n", 0, bytes_read)
+    carriage_returns = buffer.count(b"\r", 0, bytes_read)
+    if carriage_returns:
+        line_breaks += carriage_returns - buffer.count(b"\r\n", 0, bytes_read)
+
+    if size > MAX_FILE_SIZE:
+        # read_file_content drops the last, possibly partial, line and appends
+        # a blank line and the truncation notice
+        return False, (line_breaks + 2) if line_breaks else 3
+
+    # A final line without a trailing newline still counts as a line
+    return False, line_breaks + (buffer[bytes_read - 1] not in b"\r\n")
+
+
+def _extension(name: str) -> str:
+    """
+    Get a file's extension from its name, without building a Path.
+
+    Matches Path.suffix without the dot: dotfiles such as '.bashrc' and names
+    ending in a dot have no extension.
+
+    Args:
+        name: File name (the last path component)
+
+    Returns:
+        Extension without the dot, or 'no extension' if there is none
+    """
+    stem, _, extension = name.rpartition(".")
+    return extension if stem and extension else "no extension"
 
 
 class FileStatistics:
@@ -15,101 +111,124 @@ class FileStatistics:
         """Initialize the file statistics calculator."""
         pass
 
-    def get_file_types_statistics(self, files: list[Path]) -> dict[str, int]:
+    def _get_file_info(
+        self, file_path: FileLike, extension: str
+    ) -> tuple[bool, int] | None:
         """
-        Get statistics about file types (extensions) in the given file list.
+        Stat a file once and return its cached classification.
 
         Args:
-            files: List of file paths to analyze
+            file_path: Path to the file, or a DirEntry from os.scandir()
+            extension: The file's extension, as returned by _extension()
 
         Returns:
-            Dictionary mapping file extensions to their counts, sorted by count (descending)
+            Tuple of (is_binary, line_count), or None if the file cannot be read
         """
-        extension_counts: dict[str, int] = {}
-
-        for file_path in files:
-            # Skip binary files for statistics
-            if is_binary_file(file_path):
-                continue
-
-            # Get extension without the dot, or 'no extension' for files without extension
-            extension = (
-                file_path.suffix.lstrip(".") if file_path.suffix else "no extension"
+        # Known binary formats are skipped without a stat or a read
+        if extension.lower() in BINARY_EXTENSIONS:
+            return True, 0
+
+        try:
+            # DirEntry.stat() reuses the result cached during the directory scan
+            stat_result = file_path.stat()
+            return _classify(
+                os.fspath(file_path), stat_result.st_mtime_ns, stat_result.st_size
             )
-            extension_counts[extension] = extension_counts.get(extension, 0) + 1
-
-        # Sort by count (descending) and return as ordered dict
-        return dict(sorted(extension_counts.items(), key=lambda x: x[1], reverse=True))
+        except OSError:
+            return None
 
-    def get_largest_file_info(self, files: list[Path]) -> dict[str, Any] | None:
+    def _scan(
+        self, files: Sequence[FileLike]
+    ) -> tuple[Counter[str], int, dict[str, Any] | None]:
         """
-        Get information about the largest file (by line count) in the given file list.
+        Walk the file list once, gathering every statistic in the same pass.
+
+        Binary and unreadable files are skipped. Larger file lists are read on a
+        thread pool so that blocking I/O overlaps; results are reduced in input
+        order, so the outcome matches a sequential scan.
 
         Args:
-            files: List of file paths to analyze
+            files: File paths (or os.scandir() entries) to analyze
 
         Returns:
-            Dictionary with 'path' and 'lines' keys, or None if no files processed
+            Tuple of (extension counts, total lines, largest file info)
         """
+        extension_counts: Counter[str] = Counter()
+        total_lines = 0
         largest_file = None
         max_lines = 0
 
-        for file_path in files:
-            try:
-                # Skip binary files
-                if is_binary_file(file_path):
-                    continue
+        # Parse each name once; the extension drives both the binary check
+        # and the histogram
+        extensions = [_extension(file_path.name) for file_path in files]
 
-                content = read_file_content(file_path)
-                if content is None:
-                    continue
+        if len(files) < PARALLEL_THRESHOLD:
+            infos = list(map(self._get_file_info, files, extensions))
+        else:
+            with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+                infos = list(executor.map(self._get_file_info, files, extensions))
 
-                line_count = len(content.splitlines())
+        for file_path, extension, info in zip(files, extensions, infos, strict=True):
+            if info is None or info[0]:
+                continue
 
-                if line_count > max_lines:
-                    max_lines = line_count
-                    largest_file = {"path": file_path, "lines": line_count}
+            extension_counts[extension] += 1
 
-            except Exception:
-                continue
+            line_count = info[1]
+            total_lines += line_count
+            if line_count > max_lines:
+                max_lines = line_count
+                # Only the reported file needs to become a Path
+                path = file_path if isinstance(file_path, Path) else Path(file_path)
+                largest_file = {"path": path, "lines": line_count}
 
-        return largest_file
+        return extension_counts, total_lines, largest_file
 
-    def calculate_summary_stats(self, files: list[Path]) -> dict[str, Any]:
+    def get_file_types_statistics(self, files: Sequence[FileLike]) -> dict[str, int]:
         """
-        Calculate comprehensive statistics for a list of files.
+        Get statistics about file types (extensions) in the given file list.
 
         Args:
-            files: List of file paths to analyze
+            files: File paths (or os.scandir() entries) to analyze
 
         Returns:
-            Dictionary containing various file statistics
+            Dictionary mapping file extensions to their counts, sorted by count (descending)
         """
-        total_files = 0
-        total_lines = 0
-        file_types = self.get_file_types_statistics(files)
-        largest_file = self.get_largest_file_info(files)
+        extension_counts, _, _ = self._scan(files)
+
+        # most_common() is already sorted by count (descending)
+        return dict(extension_counts.most_common())
+
+    def get_largest_file_info(self, files: Sequence[FileLike]) -> dict[str, Any] | None:
+        """
+        Get information about the largest file (by line count) in the given file list.
+
+        Args:
+            files: File paths (or os.scandir() entries) to analyze
 
-        # Calculate total lines and processed files
-        for file_path in files:
-            try:
-                if is_binary_file(file_path):
-                    continue
+        Returns:
+            Dictionary with 'path' and 'lines' keys, or None if no files processed
+        """
+        _, _, largest_file = self._scan(files)
+        return largest_file
 
-                content = read_file_content(file_path)
-                if content is None:
-                    continue
+    def calculate_summary_stats(self, files: Sequence[FileLike]) -> dict[str, Any]:
+        """
+        Calculate comprehensive statistics for a list of files.
 
-                total_files += 1
-                total_lines += len(content.splitlines())
+        Args:
+            files: File paths (or os.scandir() entries) to analyze
 
-            except Exception:
-                continue
+        Returns:
+            Dictionary containing various file statistics
+        """
+        extension_counts, total_lines, largest_file = self._scan(files)
+        total_files = extension_counts.total()
 
         return {
             "total_files": total_files,
             "total_lines": total_lines,
-            "file_types": file_types,
+            "file_types": dict(extension_counts.most_common()),
             "largest_file": largest_file,
             "average_lines": total_lines // total_files if total_files > 0 else 0,
         }
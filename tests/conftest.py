@@ -1,67 +1,120 @@
 import os
+import shutil
 import subprocess
 import tempfile
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def pytest_configure(config):
+    """Keep test files in RAM on Linux by using tmpfs for temporary files."""
+    # An explicit TMPDIR wins; /dev/shm is only a better default than /tmp
+    shm = Path("/dev/shm")
+    if "TMPDIR" not in os.environ and shm.is_dir() and os.access(shm, os.W_OK):
+        tempfile.tempdir = os.fspath(shm)
+
+
+@pytest.fixture(scope="session")
+def session_root(tmp_path_factory):
+    """Create the directory holding every test's temp_dir for this session."""
+    return tmp_path_factory.mktemp("tc")
 
 
 @pytest.fixture
-def sample_git_repo(temp_dir):
-    """Create a sample git repository for testing."""
+def temp_dir(session_root):
+    """
+    Create a temporary directory for tests.
+
+    Each test gets a fresh directory under the session root. Directories are
+    not removed after each test; pytest cleans up old session roots itself.
+    """
+    return Path(tempfile.mkdtemp(dir=session_root))
+
+
+def _commit_env() -> dict[str, str]:
+    """Build an environment with a fixed git identity for test commits."""
+    env = os.environ.copy()
+    env.update(
+        {
+            "GIT_AUTHOR_NAME": "Test User",
+            "GIT_AUTHOR_EMAIL": "test@example.com",
+            "GIT_COMMITTER_NAME": "Test User",
+            "GIT_COMMITTER_EMAIL": "test@example.com",
+        }
+    )
+    return env
+
+
+@pytest.fixture(scope="session")
+def sample_git_repo(tmp_path_factory):
+    """
+    Create a sample git repository for testing.
+
+    The repository is created once per session and shared; tests must not
+    modify it. Tests that need to change it should use sample_git_repo_copy.
+    """
+    repo_dir = tmp_path_factory.mktemp("git_repo")
+
     # Initialize git repo
     subprocess.run(
         ["git", "init"],
-        cwd=temp_dir,
+        cwd=repo_dir,
         check=True,
         capture_output=True,
         text=True,
     )
 
     # Create sample files
-    (temp_dir / "README.md").write_text("# Test Repository\n\nThis is a test.")
-    (temp_dir / "main.py").write_text('print("Hello, World!")\n')
-    (temp_dir / "utils.py").write_text('def helper():\n    return "help"\n')
+    (repo_dir / "README.md").write_text("# Test Repository\n\nThis is a test.")
+    (repo_dir / "main.py").write_text('print("Hello, World!")\n')
+    (repo_dir / "utils.py").write_text('def helper():\n    return "help"\n')
 
     # Create a subdirectory with files
-    src_dir = temp_dir / "src"
+    src_dir = repo_dir / "src"
     src_dir.mkdir()
     (src_dir / "app.py").write_text('def main():\n    print("app")\n')
 
     # Add and commit
     subprocess.run(
         ["git", "add", "."],
-        cwd=temp_dir,
+        cwd=repo_dir,
         check=True,
         capture_output=True,
     )
 
-    env = os.environ.copy()
-    env.update(
-        {
-            "GIT_AUTHOR_NAME": "Test User",
-            "GIT_AUTHOR_EMAIL": "test@example.com",
-            "GIT_COMMITTER_NAME": "Test User",
-            "GIT_COMMITTER_EMAIL": "test@example.com",
-        }
-    )
-
     subprocess.run(
         ["git", "commit", "-m", "Initial commit"],
-        cwd=temp_dir,
+        cwd=repo_dir,
         check=True,
         capture_output=True,
-        env=env,
+        env=_commit_env(),
     )
 
-    return temp_dir
+    return repo_dir
+
+
+@pytest.fixture
+def sample_git_repo_copy(sample_git_repo, tmp_path):
+    """Create a private copy of the sample git repository that tests may modify."""
+    return Path(shutil.copytree(sample_git_repo, tmp_path / "repo"))
+
+
+@pytest.fixture
+def git_runner(monkeypatch):
+    """Replace the runner used for git commands with a Mock for one test."""
+    runner = Mock()
+    monkeypatch.setattr("contextr.git.git_operations._run_git", runner)
+    return runner
+
+
+@pytest.fixture
+def git_popen(monkeypatch):
+    """Replace the launcher used for streamed git commands with a Mock."""
+    popen = Mock()
+    monkeypatch.setattr("contextr.git.git_operations._popen_git", popen)
+    return popen
 
 
 @pytest.fixture
@@ -115,50 +168,65 @@ def empty_dir(temp_dir):
     return temp_dir
 
 
-@pytest.fixture
-def recent_files_repo(sample_git_repo):
-    """Create a git repo with recent and old files."""
+@pytest.fixture(scope="session")
+def recent_files_repo(sample_git_repo, tmp_path_factory):
+    """
+    Create a git repo with recent and old files.
+
+    Built once per session from a copy of sample_git_repo; tests must not
+    modify it.
+    """
     import time
 
+    repo_dir = Path(
+        shutil.copytree(sample_git_repo, tmp_path_factory.mktemp("recent") / "repo")
+    )
+
     # The sample_git_repo already has files
     # Add a new file and commit (will be recent)
     time.sleep(1)  # Ensure different timestamp
 
-    new_file = sample_git_repo / "new_file.py"
+    new_file = repo_dir / "new_file.py"
     new_file.write_text('def new_func():\n    return "new"\n')
 
     subprocess.run(
         ["git", "add", "new_file.py"],
-        cwd=sample_git_repo,
+        cwd=repo_dir,
         check=True,
         capture_output=True,
     )
 
-    env = os.environ.copy()
-    env.update(
-        {
-            "GIT_AUTHOR_NAME": "Test User",
-            "GIT_AUTHOR_EMAIL": "test@example.com",
-            "GIT_COMMITTER_NAME": "Test User",
-            "GIT_COMMITTER_EMAIL": "test@example.com",
-        }
-    )
-
     subprocess.run(
         ["git", "commit", "-m", "Add new file"],
-        cwd=sample_git_repo,
+        cwd=repo_dir,
         check=True,
         capture_output=True,
-        env=env,
+        env=_commit_env(),
     )
 
-    return sample_git_repo
+    return repo_dir
 
 
-@pytest.fixture
-def sample_python_file(temp_dir):
-    """Create a sample Python file."""
-    file_path = temp_dir / "sample.py"
+@pytest.fixture(scope="session")
+def binary_file(tmp_path_factory):
+    """
+    Create a sample binary file.
+
+    The file is created once per session and shared; tests must not modify it.
+    """
+    file_path = tmp_path_factory.mktemp("binary") / "binary.dat"
+    file_path.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
+    return file_path
+
+
+@pytest.fixture(scope="session")
+def sample_python_file(tmp_path_factory):
+    """
+    Create a sample Python file.
+
+    The file is created once per session and shared; tests must not modify it.
+    """
+    file_path = tmp_path_factory.mktemp("sample") / "sample.py"
     content = '''"""Sample Python module."""
 
 
@@ -28,3 +28,19 @@ def test_pytest_markers():
 
     # Verify pytest is working
     assert pytest.__version__ is not None
+
+
+def test_processing_import_does_not_load_cli_stack():
+    """Test that the processing package can be imported without typer or rich."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, contextr.processing; "
+        "print('typer' in sys.modules or 'rich' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
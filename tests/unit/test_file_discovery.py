@@ -1,7 +1,11 @@
+import os
 from unittest.mock import patch
 
+import pytest
+
 from contextr.discovery.file_discovery import (
     discover_files,
+    scan_files,
     should_include_file,
     should_skip_path,
 )
@@ -79,8 +83,8 @@ class TestDiscoverFiles:
 
     def test_discover_permission_error(self, temp_dir, capsys):
         """Test handling of permission errors."""
-        with patch("pathlib.Path.rglob") as mock_rglob:
-            mock_rglob.side_effect = PermissionError("Access denied")
+        with patch("os.scandir") as mock_scandir:
+            mock_scandir.side_effect = PermissionError("Access denied")
 
             result = discover_files([temp_dir])
             assert result == []
@@ -100,6 +104,44 @@ class TestDiscoverFiles:
         assert result == []
 
 
+class TestScanFiles:
+    """Test the scan_files function."""
+
+    def test_scan_matches_rglob(self, mock_files_dir):
+        """Test that scanning finds the same files as rglob minus skipped dirs."""
+        expected = {
+            f
+            for f in mock_files_dir.rglob("*")
+            if f.is_file() and not should_skip_path(f.relative_to(mock_files_dir))
+        }
+
+        assert set(scan_files(mock_files_dir)) == expected
+
+    def test_scan_prunes_skipped_directories(self, temp_dir):
+        """Test that skipped directories are never listed."""
+        (temp_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_dir / "node_modules" / "pkg" / "index.js").write_text("x")
+        (temp_dir / "keep.py").write_text("x")
+
+        with patch("os.scandir", wraps=os.scandir) as mock_scandir:
+            result = list(scan_files(temp_dir))
+
+        assert result == [temp_dir / "keep.py"]
+        assert mock_scandir.call_count == 1
+
+    def test_scan_does_not_follow_directory_symlinks(self, temp_dir):
+        """Test that symlinked directories are not descended into."""
+        real = temp_dir / "real"
+        real.mkdir()
+        (real / "file.py").write_text("x")
+        try:
+            (temp_dir / "link").symlink_to(real, target_is_directory=True)
+        except OSError:
+            pytest.skip("Creating symlinks is not permitted on this system")
+
+        assert list(scan_files(temp_dir)) == [real / "file.py"]
+
+
 class TestShouldIncludeFile:
     """Test the should_include_file function."""
 
@@ -1,4 +1,6 @@
+from contextr.config import MAX_FILE_SIZE
 from contextr.processing.file_reader import (
+    count_lines,
     format_file_size,
     is_binary_file,
     read_file_content,
@@ -31,6 +33,12 @@ class TestFormatFileSize:
         assert format_file_size(5 * 1024 * 1024) == "5.0 MB"
         assert format_file_size(10 * 1024 * 1024) == "10.0 MB"
 
+    def test_gigabytes_and_terabytes(self):
+        """Test formatting file sizes in GB and TB range."""
+        assert format_file_size(3 * 1024**3) == "3.0 GB"
+        assert format_file_size(2 * 1024**4) == "2.0 TB"
+        assert format_file_size(2048 * 1024**4) == "2048.0 TB"
+
     def test_fractional_kilobytes(self):
         """Test formatting fractional KB values."""
         result = format_file_size(1536)  # 1.5 KB
@@ -55,6 +63,27 @@ class TestFormatFileSize:
         assert format_file_size(1024 * 1024 - 1).endswith("KB")
 
 
+class TestCountLines:
+    """Tests for count_lines function - simple pure function."""
+
+    def test_empty_string_has_no_lines(self):
+        """Test that empty text has zero lines."""
+        assert count_lines("") == 0
+
+    def test_single_line_without_newline(self):
+        """Test that a final line without a trailing newline is counted."""
+        assert count_lines("only line") == 1
+
+    def test_trailing_newline_does_not_add_a_line(self):
+        """Test that a trailing newline terminates the last line."""
+        assert count_lines("line 1\nline 2\n") == 2
+        assert count_lines("line 1\nline 2") == 2
+
+    def test_blank_lines_are_counted(self):
+        """Test that blank lines in the middle of text are counted."""
+        assert count_lines("a\n\n\nb") == 4
+
+
 class TestIsBinaryFile:
     """Tests for is_binary_file function - handles file I/O."""
 
@@ -111,11 +140,26 @@ class TestIsBinaryFile:
 
         assert is_binary_file(pyc_file) is True
 
+    def test_text_with_nul_byte_is_binary(self, temp_dir):
+        """Test that a single NUL byte marks otherwise textual content as binary."""
+        nul_file = temp_dir / "data.txt"
+        nul_file.write_bytes(b"mostly text" * 20 + b"\x00")
+
+        assert is_binary_file(nul_file) is True
+
+    def test_binary_extension_is_binary_without_reading(self, temp_dir):
+        """Test that known binary extensions are binary even with text content."""
+        for name in ("notes.bin", "module.O", "libfoo.a"):
+            text_file = temp_dir / name
+            text_file.write_text("plain text\n", encoding="utf-8")
+
+            assert is_binary_file(text_file) is True
+
     # EDGE CASES: Empty and special files
     def test_empty_file_is_not_binary(self, temp_dir):
         """Test that empty files are not considered binary."""
         empty_file = temp_dir / "empty.txt"
-        empty_file.write_text("", encoding="utf-8")
+        empty_file.touch()
 
         assert is_binary_file(empty_file) is False
 
@@ -126,6 +170,20 @@ class TestIsBinaryFile:
 
         assert is_binary_file(unicode_file) is False
 
+    def test_utf16_file_with_bom_is_not_binary(self, temp_dir):
+        """Test that UTF-16 text is not binary despite its NUL bytes."""
+        utf16_file = temp_dir / "utf16.txt"
+        utf16_file.write_text("Hello, World!\n", encoding="utf-16")
+
+        assert is_binary_file(utf16_file) is False
+
+    def test_control_bytes_without_nul_are_binary(self, temp_dir):
+        """Test that files dominated by control bytes are binary even without NULs."""
+        noise_file = temp_dir / "noise.dat"
+        noise_file.write_bytes(bytes(range(1, 7)) * 20 + b"some text")
+
+        assert is_binary_file(noise_file) is True
+
     # ERROR CASES: Nonexistent files
     def test_nonexistent_file_treated_as_binary(self, temp_dir):
         """Test that nonexistent files are treated as binary (error handling)."""
@@ -172,7 +230,7 @@ class TestReadFileContent:
     def test_read_empty_file(self, temp_dir):
         """Test reading an empty file returns empty string."""
         test_file = temp_dir / "empty.txt"
-        test_file.write_text("", encoding="utf-8")
+        test_file.touch()
 
         result = read_file_content(test_file)
 
@@ -201,13 +259,22 @@ class TestReadFileContent:
         lines = result.splitlines()
         assert len(lines) >= 3
 
+    def test_read_file_normalizes_crlf_line_endings(self, temp_dir):
+        """Test that CRLF and lone CR line endings are read as LF."""
+        test_file = temp_dir / "crlf.txt"
+        test_file.write_bytes(b"Line 1\r\nLine 2\rLine 3\r\n")
+
+        result = read_file_content(test_file)
+
+        assert result == "Line 1\nLine 2\nLine 3\n"
+
     # CODE PATH: Large file truncation
     def test_large_file_is_truncated(self, temp_dir):
         """Test that large files (>16KB) are truncated with notice."""
         test_file = temp_dir / "large.txt"
         # Create a file larger than MAX_FILE_SIZE (16KB)
-        large_content = "Line of text\n" * 2000  # ~24KB
-        test_file.write_text(large_content, encoding="utf-8")
+        large_content = b"Line of text\n" * 2000  # ~24KB
+        test_file.write_bytes(large_content)
 
         result = read_file_content(test_file)
 
@@ -218,14 +285,25 @@ class TestReadFileContent:
     def test_truncated_file_has_notice(self, temp_dir):
         """Test that truncated files include truncation notice."""
         test_file = temp_dir / "large.txt"
-        large_content = "x" * (20 * 1024)  # 20KB
-        test_file.write_text(large_content, encoding="utf-8")
+        test_file.write_bytes(b"x" * (20 * 1024))  # 20KB
 
         result = read_file_content(test_file)
 
         assert "File truncated" in result
         assert "showing first" in result.lower()
 
+    def test_truncated_file_keeps_at_most_max_file_size(self, temp_dir):
+        """Test that truncated content never exceeds MAX_FILE_SIZE bytes."""
+        test_file = temp_dir / "large.txt"
+        test_file.write_bytes(b"Line of text\n" * 4000)
+
+        result = read_file_content(test_file)
+
+        body, _, notice = result.partition("\n\n... [File truncated")
+        assert notice
+        assert len(body.encode("utf-8")) <= MAX_FILE_SIZE
+        assert body.endswith("Line of text")
+
     # ERROR CASES: Nonexistent and unreadable files
     def test_nonexistent_file_returns_none(self, temp_dir):
         """Test that reading nonexistent file returns None."""
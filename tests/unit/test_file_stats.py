@@ -1,5 +1,10 @@
+import os
+import threading
 from pathlib import Path
 
+from contextr.config import MAX_FILE_SIZE
+from contextr.processing import count_lines, read_file_content
+from contextr.statistics import file_stats
 from contextr.statistics.file_stats import FileStatistics
 
 
@@ -52,6 +57,24 @@ class TestGetFileTypesStatistics:
         assert "no extension" in result
         assert result["no extension"] == 1
 
+    def test_get_file_types_statistics_matches_path_suffix(self, temp_dir):
+        """Test that extensions are derived exactly like Path.suffix."""
+        stats = FileStatistics()
+        names = ["notes.draft.md", ".bashrc", "trailing.", "Makefile", "a..b"]
+        files = []
+        for name in names:
+            file_path = temp_dir / name
+            file_path.write_text("text", encoding="utf-8")
+            files.append(file_path)
+
+        result = stats.get_file_types_statistics(files)
+
+        expected: dict[str, int] = {}
+        for file_path in files:
+            key = file_path.suffix.lstrip(".") or "no extension"
+            expected[key] = expected.get(key, 0) + 1
+        assert result == expected
+
     def test_get_file_types_statistics_empty_list(self):
         """Test statistics with empty file list."""
         stats = FileStatistics()
@@ -70,7 +93,9 @@ class TestGetFileTypesStatistics:
             (temp_dir / f"file{i}.txt").write_text(f"Text {i}", encoding="utf-8")
         (temp_dir / "doc.md").write_text("# Markdown", encoding="utf-8")
 
-        files = list(temp_dir.glob("*"))
+        # DirEntry objects carry their stat result from the directory scan
+        with os.scandir(temp_dir) as entries:
+            files = list(entries)
         result = stats.get_file_types_statistics(files)
 
         # Convert to list to check order
@@ -94,6 +119,28 @@ class TestGetFileTypesStatistics:
         assert "py" in result
         assert "dat" not in result  # Binary file should be skipped
 
+    def test_get_file_types_statistics_skips_known_binary_extensions(
+        self, temp_dir, monkeypatch
+    ):
+        """Test that files with binary extensions are skipped without being read."""
+        stats = FileStatistics()
+        image = temp_dir / "picture.PNG"
+        image.write_text("not really an image", encoding="utf-8")
+        source = temp_dir / "main.py"
+        source.write_text("print('hi')", encoding="utf-8")
+
+        opened = []
+
+        def counting_open(path, *args, **kwargs):
+            opened.append(path)
+            return open(path, *args, **kwargs)
+
+        monkeypatch.setattr(file_stats, "open", counting_open, raising=False)
+        result = stats.get_file_types_statistics([image, source])
+
+        assert result == {"py": 1}
+        assert str(image) not in opened
+
     def test_get_file_types_statistics_mixed_case_extensions(self, mock_files_dir):
         """Test statistics with mixed case extensions."""
         stats = FileStatistics()
@@ -107,6 +154,7 @@ class TestGetFileTypesStatistics:
 
         # Both should be counted (case-sensitive)
         assert isinstance(result, dict)
+        assert result == {"PY": 1, "py": 1}
 
 
 class TestGetLargestFileInfo:
@@ -166,8 +214,8 @@ class TestGetLargestFileInfo:
         stats = FileStatistics()
         file1 = temp_dir / "empty1.txt"
         file2 = temp_dir / "empty2.txt"
-        file1.write_text("", encoding="utf-8")
-        file2.write_text("", encoding="utf-8")
+        file1.touch()
+        file2.touch()
 
         files = [file1, file2]
         result = stats.get_largest_file_info(files)
@@ -189,6 +237,19 @@ class TestGetLargestFileInfo:
 
         assert result is None
 
+    def test_get_largest_file_info_from_dir_entries(self, temp_dir):
+        """Test that os.scandir() entries are accepted and reported as Paths."""
+        stats = FileStatistics()
+        (temp_dir / "small.py").write_text("line 1", encoding="utf-8")
+        (temp_dir / "large.py").write_text("line 1\nline 2\nline 3", encoding="utf-8")
+
+        with os.scandir(temp_dir) as entries:
+            result = stats.get_largest_file_info(list(entries))
+
+        assert result["path"] == temp_dir / "large.py"
+        assert isinstance(result["path"], Path)
+        assert result["lines"] == 3
+
     def test_get_largest_file_info_return_type(self, mock_files_dir):
         """Test that get_largest_file_info returns correct types."""
         stats = FileStatistics()
@@ -267,6 +328,141 @@ class TestCalculateSummaryStats:
         assert result["total_files"] == 1
         assert result["total_lines"] == 2
 
+    def test_calculate_summary_stats_counts_truncated_files_like_report(self, temp_dir):
+        """Test that files over MAX_FILE_SIZE count the lines the report shows."""
+        stats = FileStatistics()
+        contents = [
+            b"Line of text\n" * 6000 + b"last line",
+            b"Line of text\r\n" * 6000,
+            b"Line of text\r" * 6000,
+            b"x" * (MAX_FILE_SIZE + 100),
+            # A CRLF split by the size limit
+            b"x" * (MAX_FILE_SIZE - 1) + b"\r\nlast",
+        ]
+
+        for index, content in enumerate(contents):
+            big_file = temp_dir / f"big{index}.txt"
+            big_file.write_bytes(content)
+
+            result = stats.calculate_summary_stats([big_file])
+
+            assert result["total_lines"] == count_lines(read_file_content(big_file))
+
+    def test_calculate_summary_stats_matches_report_line_counts(self, temp_dir):
+        """Test that CR and CRLF line endings are counted like the report does."""
+        stats = FileStatistics()
+        contents = [
+            b"a\rb\rc",
+            b"a\r\nb\r\nc\r\n",
+            b"a\rb\nc\r\n\r",
+        ]
+
+        for index, content in enumerate(contents):
+            text_file = temp_dir / f"endings{index}.txt"
+            text_file.write_bytes(content)
+
+            result = stats.calculate_summary_stats([text_file])
+
+            assert result["total_lines"] == count_lines(read_file_content(text_file))
+
+    def test_calculate_summary_stats_sees_modified_files(self, temp_dir):
+        """Test that cached results are refreshed when a file changes on disk."""
+        stats = FileStatistics()
+        file1 = temp_dir / "changing.py"
+        file1.write_text("line 1", encoding="utf-8")
+        assert stats.calculate_summary_stats([file1])["total_lines"] == 1
+
+        file1.write_text("line 1\nline 2\nline 3", encoding="utf-8")
+
+        assert stats.calculate_summary_stats([file1])["total_lines"] == 3
+
+    def test_calculate_summary_stats_visits_each_file_once(
+        self, mock_files_dir, monkeypatch
+    ):
+        """Test that the summary is computed in a single pass over the files."""
+        stats = FileStatistics()
+        file1 = mock_files_dir / "a.py"
+        file2 = mock_files_dir / "b.txt"
+        file1.write_text("line 1\nline 2", encoding="utf-8")
+        file2.write_text("line 1", encoding="utf-8")
+
+        visited = []
+        original = FileStatistics._get_file_info
+
+        def tracking_get_file_info(self, file_path, extension):
+            visited.append(file_path)
+            return original(self, file_path, extension)
+
+        monkeypatch.setattr(FileStatistics, "_get_file_info", tracking_get_file_info)
+        stats.calculate_summary_stats([file1, file2])
+
+        assert visited == [file1, file2]
+
+    def test_line_count_is_cached(self, temp_dir, monkeypatch):
+        """Test that unchanged files are read only once across calls."""
+        stats = FileStatistics()
+        file1 = temp_dir / "cached_a.py"
+        file2 = temp_dir / "cached_b.py"
+        file1.write_text("line 1\nline 2", encoding="utf-8")
+        file2.write_text("line 1", encoding="utf-8")
+
+        opened = []
+
+        def counting_open(path, *args, **kwargs):
+            opened.append(path)
+            return open(path, *args, **kwargs)
+
+        monkeypatch.setattr(file_stats, "open", counting_open, raising=False)
+        stats.get_largest_file_info([file1, file2])
+        result = stats.calculate_summary_stats([file1, file2])
+
+        assert result["total_lines"] == 3
+        assert sorted(opened) == sorted([str(file1), str(file2)])
+
+    def test_calculate_summary_stats_many_files(self, temp_dir):
+        """Test that large file lists (scanned concurrently) give exact results."""
+        stats = FileStatistics()
+        files = []
+        for i in range(40):
+            file_path = temp_dir / f"file{i:02}.{'py' if i % 2 else 'txt'}"
+            file_path.write_text("line\n" * (i % 5 + 1), encoding="utf-8")
+            files.append(file_path)
+        (temp_dir / "blob.bin").write_bytes(b"\x00" * 64)
+        files.append(temp_dir / "blob.bin")
+
+        result = stats.calculate_summary_stats(files)
+
+        assert result["total_files"] == 40
+        assert result["total_lines"] == sum(i % 5 + 1 for i in range(40))
+        assert result["file_types"] == {"txt": 20, "py": 20}
+        # Ties are resolved in input order, exactly as in a sequential scan
+        assert result["largest_file"] == {"path": files[4], "lines": 5}
+
+    def test_calculate_summary_stats_reads_files_concurrently(
+        self, temp_dir, monkeypatch
+    ):
+        """Test that reads of many files overlap instead of running serially."""
+        stats = FileStatistics()
+        files = []
+        for i in range(64):
+            file_path = temp_dir / f"slow{i:02}.py"
+            file_path.write_text("line\n", encoding="utf-8")
+            files.append(file_path)
+
+        # Each read waits for a second, concurrent read; run serially, the
+        # first wait times out and breaks the barrier
+        barrier = threading.Barrier(2, timeout=10)
+
+        def paired_classify(path_str, mtime_ns, size):
+            barrier.wait()
+            return False, 1
+
+        monkeypatch.setattr(file_stats, "_classify", paired_classify)
+        result = stats.calculate_summary_stats(files)
+
+        assert result["total_lines"] == 64
+        assert not barrier.broken
+
     def test_calculate_summary_stats_file_types_included(self, mock_files_dir):
         """Test that file types are included in summary."""
         stats = FileStatistics()
@@ -307,14 +503,14 @@ class TestCalculateSummaryStats:
         files = [file1]
         result = stats.calculate_summary_stats(files)
 
-        required_fields = [
+        required_fields = {
             "total_files",
             "total_lines",
             "file_types",
             "largest_file",
             "average_lines",
-        ]
-        assert all(field in result for field in required_fields)
+        }
+        assert required_fields <= result.keys()
 
     def test_calculate_summary_stats_return_types(self, mock_files_dir):
         """Test that summary stats returns correct types."""
@@ -1,14 +1,30 @@
+import io
+import os
 import subprocess
+import sys
+import threading
+from pathlib import Path
 from unittest.mock import Mock, patch
 
+from contextr.git import git_operations
 from contextr.git.git_operations import (
     find_git_root,
     get_file_git_timestamp,
+    get_file_git_timestamps,
     get_git_info,
     get_recent_git_files,
 )
 
 
+def _mock_process(stdout: bytes, returncode: int = 0) -> Mock:
+    """Build a fake Popen object streaming the given stdout."""
+    return Mock(
+        stdout=io.BytesIO(stdout),
+        poll=Mock(return_value=returncode),
+        wait=Mock(return_value=returncode),
+    )
+
+
 class TestFindGitRoot:
     """Test the find_git_root function."""
 
@@ -34,6 +50,22 @@ class TestFindGitRoot:
         result = find_git_root(nonexistent)
         assert result is None
 
+    def test_find_git_root_sees_repositories_created_later(self, temp_dir):
+        """Test that a nested repository created after a lookup is found."""
+        (temp_dir / ".git").mkdir()
+        subdir = temp_dir / "sub"
+        subdir.mkdir()
+        assert find_git_root(subdir).resolve() == temp_dir.resolve()
+
+        (subdir / ".git").mkdir()
+
+        assert find_git_root(subdir).resolve() == subdir.resolve()
+
+        # And a removed repository is no longer reported
+        (subdir / ".git").rmdir()
+        (temp_dir / ".git").rmdir()
+        assert find_git_root(subdir) is None
+
 
 class TestGetGitInfo:
     """Test the get_git_info function."""
@@ -55,31 +87,47 @@ class TestGetGitInfo:
         result = get_git_info(non_git_dir)
         assert result is None
 
-    def test_get_git_info_git_command_failure(self, sample_git_repo):
+    def test_get_git_info_git_command_failure(self, sample_git_repo, git_runner):
         """Test handling git command failures."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.CalledProcessError(1, "git")
-            result = get_git_info(sample_git_repo)
-            assert result is None
+        git_runner.side_effect = subprocess.CalledProcessError(1, "git")
+        result = get_git_info(sample_git_repo)
+        assert result is None
 
-    def test_get_git_info_no_commits(self, temp_dir):
+    def test_get_git_info_no_commits(self, temp_dir, git_runner):
         """Test getting git info from repo with no commits."""
         # Create empty git repo
         git_dir = temp_dir / ".git"
         git_dir.mkdir()
 
-        with patch("subprocess.run") as mock_run:
-            # Mock git commands to return empty strings (no commits)
-            mock_run.return_value = Mock(stdout="", returncode=0)
-            result = get_git_info(temp_dir)
-            assert result is None
+        # Mock git commands to return empty strings (no commits)
+        git_runner.return_value = Mock(stdout="", returncode=0)
+        result = get_git_info(temp_dir)
+        assert result is None
+
+    def test_get_git_info_parses_combined_log_output(self, sample_git_repo, git_runner):
+        """Test that commit, author and date come from one git log call."""
+        git_runner.side_effect = [
+            Mock(
+                stdout="abc123\nTest User <test@example.com>\nMon Jan 15 2024\n",
+                returncode=0,
+            ),
+            Mock(stdout="main\n", returncode=0),
+        ]
+        result = get_git_info(sample_git_repo)
+
+        assert git_runner.call_count == 2
+        assert result == {
+            "commit": "abc123",
+            "branch": "main",
+            "author": "Test User <test@example.com>",
+            "date": "Mon Jan 15 2024",
+        }
 
-    def test_get_git_info_git_not_found(self, sample_git_repo):
+    def test_get_git_info_git_not_found(self, sample_git_repo, git_runner):
         """Test handling when git command is not found."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError("git not found")
-            result = get_git_info(sample_git_repo)
-            assert result is None
+        git_runner.side_effect = FileNotFoundError("git not found")
+        result = get_git_info(sample_git_repo)
+        assert result is None
 
     def test_get_git_info_exception_handling(self, sample_git_repo, capsys):
         """Test exception handling in get_git_info."""
@@ -108,20 +156,24 @@ class TestGetRecentGitFiles:
         result = get_recent_git_files(non_git_dir)
         assert result == []
 
-    def test_get_recent_files_no_recent_commits(self, sample_git_repo):
+    def test_get_recent_files_no_recent_commits(self, sample_git_repo, git_popen):
         """Test getting recent files when no recent commits exist."""
-        with patch("subprocess.run") as mock_run:
-            # Mock git log to return empty output
-            mock_run.return_value = Mock(stdout="", returncode=0)
-            result = get_recent_git_files(sample_git_repo)
-            assert result == []
+        # Mock git log to stream empty output
+        git_popen.return_value = _mock_process(b"")
+        result = get_recent_git_files(sample_git_repo)
+        assert result == []
 
-    def test_get_recent_files_git_command_failure(self, sample_git_repo):
+    def test_get_recent_files_git_command_failure(self, sample_git_repo, git_popen):
         """Test handling git command failures in recent files."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.CalledProcessError(1, "git")
-            result = get_recent_git_files(sample_git_repo)
-            assert result == []
+        git_popen.return_value = _mock_process(b"", returncode=128)
+        result = get_recent_git_files(sample_git_repo)
+        assert result == []
+
+    def test_get_recent_files_git_not_found(self, sample_git_repo, git_popen):
+        """Test handling when git command is not found in recent files."""
+        git_popen.side_effect = FileNotFoundError("git not found")
+        result = get_recent_git_files(sample_git_repo)
+        assert result == []
 
     def test_get_recent_files_custom_days(self, recent_files_repo):
         """Test getting recent files with custom day count."""
@@ -138,24 +190,92 @@ class TestGetRecentGitFiles:
             captured = capsys.readouterr()
             assert "Error getting recent git files" in captured.err
 
-    def test_get_recent_files_removes_duplicates(self, sample_git_repo):
+    def test_get_recent_files_removes_duplicates(self, sample_git_repo, git_popen):
         """Test that duplicate files are removed from recent files."""
-        with patch("subprocess.run") as mock_run:
-            # Mock git log to return duplicate file entries
-            mock_run.return_value = Mock(
-                stdout="file1.py\nfile2.py\nfile1.py\nfile3.py\n", returncode=0
-            )
+        # Mock git log to stream duplicate file entries
+        git_popen.return_value = _mock_process(
+            b"file1.py\0file2.py\0\0file1.py\0file3.py\0"
+        )
 
-            # Mock file existence
-            with (
-                patch("pathlib.Path.exists", return_value=True),
-                patch("pathlib.Path.is_file", return_value=True),
-            ):
-                result = get_recent_git_files(sample_git_repo)
+        with patch("pathlib.Path.is_file", return_value=True):
+            result = get_recent_git_files(sample_git_repo)
 
-                # Should have unique files only
-                file_names = [f.name for f in result]
-                assert len(file_names) == len(set(file_names))
+        git_root = find_git_root(sample_git_repo)
+        assert result == [
+            git_root / "file1.py",
+            git_root / "file2.py",
+            git_root / "file3.py",
+        ]
+
+    def test_get_recent_files_unusual_names(self, sample_git_repo_copy):
+        """Test that names with spaces, newlines or non-ASCII text are kept intact."""
+        names = ["with space.py", "café.md"]
+        if sys.platform != "win32":  # Windows forbids newlines in file names
+            names.append("new\nline.py")
+        for name in names:
+            (sample_git_repo_copy / name).write_text("content\n")
+        subprocess.run(
+            ["git", "add", "--", *names], cwd=sample_git_repo_copy, check=True
+        )
+        subprocess.run(
+            [
+                "git",
+                "-c",
+                "user.name=Test User",
+                "-c",
+                "user.email=test@example.com",
+                "commit",
+                "-m",
+                "Add oddly named files",
+            ],
+            cwd=sample_git_repo_copy,
+            check=True,
+            capture_output=True,
+        )
+
+        result = get_recent_git_files(sample_git_repo_copy)
+
+        assert set(names) <= {f.name for f in result}
+
+    def test_get_recent_files_stats_each_file_once(self, sample_git_repo, git_popen):
+        """Test that each recent file is checked with a single stat call."""
+        git_popen.return_value = _mock_process(b"README.md\0missing.py\0")
+        stat_calls = []
+        original_stat = Path.stat
+
+        def counting_stat(self, *args, **kwargs):
+            stat_calls.append(self)
+            return original_stat(self, *args, **kwargs)
+
+        with patch("pathlib.Path.stat", counting_stat):
+            result = get_recent_git_files(sample_git_repo)
+
+        readme = sample_git_repo / "README.md"
+        missing = sample_git_repo / "missing.py"
+        assert result == [readme]
+        assert stat_calls.count(readme) == 1
+        assert stat_calls.count(missing) == 1
+
+    def test_get_recent_files_checks_existence_concurrently(
+        self, sample_git_repo, git_popen
+    ):
+        """Test that existence checks for many recent files overlap."""
+        names = b"".join(b"file%d.py\0" % i for i in range(64))
+
+        # Each check waits for a second, concurrent check; run serially, the
+        # first wait times out and breaks the barrier
+        barrier = threading.Barrier(2, timeout=10)
+
+        def paired_is_file(self):
+            barrier.wait()
+            return True
+
+        git_popen.return_value = _mock_process(names)
+        with patch("pathlib.Path.is_file", paired_is_file):
+            result = get_recent_git_files(sample_git_repo)
+
+        assert [f.name for f in result] == [f"file{i}.py" for i in range(64)]
+        assert not barrier.broken
 
 
 class TestGetFileGitTimestamp:
@@ -175,44 +295,51 @@ class TestGetFileGitTimestamp:
         result = get_file_git_timestamp(nonexistent, sample_git_repo)
         assert result is None
 
-    def test_get_file_timestamp_git_command_failure(self, sample_git_repo):
+    def test_get_timestamp_for_uncommitted_file(self, sample_git_repo_copy):
+        """Test that a file never committed has no timestamp."""
+        uncommitted = sample_git_repo_copy / "uncommitted.py"
+        uncommitted.write_text("x = 1\n")
+
+        assert get_file_git_timestamp(uncommitted, sample_git_repo_copy) is None
+        readme = sample_git_repo_copy / "README.md"
+        assert get_file_git_timestamp(readme, sample_git_repo_copy) is not None
+
+    def test_get_file_timestamp_git_command_failure(self, sample_git_repo, git_runner):
         """Test handling git command failures in timestamp retrieval."""
         test_file = sample_git_repo / "README.md"
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.CalledProcessError(1, "git")
-            result = get_file_git_timestamp(test_file, sample_git_repo)
-            assert result is None
+        git_runner.side_effect = subprocess.CalledProcessError(1, "git")
+        result = get_file_git_timestamp(test_file, sample_git_repo)
+        assert result is None
 
-    def test_get_file_timestamp_no_commits_for_file(self, sample_git_repo):
+    def test_get_file_timestamp_no_commits_for_file(self, sample_git_repo, git_runner):
         """Test getting timestamp when file has no commits."""
         test_file = sample_git_repo / "README.md"
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(stdout="", returncode=0)
-            result = get_file_git_timestamp(test_file, sample_git_repo)
-            assert result is None
+        git_runner.return_value = Mock(stdout="", returncode=0)
+        result = get_file_git_timestamp(test_file, sample_git_repo)
+        assert result is None
 
-    def test_get_file_timestamp_valid_output(self, sample_git_repo):
+    def test_get_file_timestamp_valid_output(self, sample_git_repo, git_runner):
         """Test parsing valid git timestamp output."""
         test_file = sample_git_repo / "README.md"
 
-        with patch("subprocess.run") as mock_run:
-            # Mock git log output with timestamp
-            mock_run.return_value = Mock(
-                stdout="2024-01-15 14:30:22 -0500", returncode=0
-            )
-            result = get_file_git_timestamp(test_file, sample_git_repo)
-            assert result == "2024-01-15 14:30:22"
+        git_runner.return_value = Mock(stdout="2024-01-15 14:30:22 -0500", returncode=0)
+        result = get_file_git_timestamp(test_file, sample_git_repo)
+        assert result == "2024-01-15 14:30:22"
+
+        # Only this file's latest commit is asked for
+        args = git_runner.call_args.args[0]
+        assert "-1" in args
+        assert args[args.index("--") + 1 :] == ["README.md"]
 
-    def test_get_file_timestamp_file_not_found_error(self, sample_git_repo):
+    def test_get_file_timestamp_file_not_found_error(self, sample_git_repo, git_runner):
         """Test handling FileNotFoundError in timestamp retrieval."""
         test_file = sample_git_repo / "README.md"
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError("git not found")
-            result = get_file_git_timestamp(test_file, sample_git_repo)
-            assert result is None
+        git_runner.side_effect = FileNotFoundError("git not found")
+        result = get_file_git_timestamp(test_file, sample_git_repo)
+        assert result is None
 
     def test_get_file_timestamp_value_error(self, sample_git_repo):
         """Test handling ValueError in timestamp retrieval."""
@@ -222,3 +349,207 @@ class TestGetFileGitTimestamp:
             mock_relative.side_effect = ValueError("Path error")
             result = get_file_git_timestamp(test_file, sample_git_repo)
             assert result is None
+
+
+class TestGetFileGitTimestamps:
+    """Test the batched get_file_git_timestamps function."""
+
+    def test_get_timestamps_valid_repo(self, sample_git_repo):
+        """Test getting timestamps for several committed files at once."""
+        files = [sample_git_repo / "README.md", sample_git_repo / "src" / "app.py"]
+        result = get_file_git_timestamps(files, sample_git_repo)
+
+        assert set(result) == set(files)
+        assert all(len(timestamp) == 19 for timestamp in result.values())
+
+    def test_get_timestamps_uses_single_git_call(self, sample_git_repo, git_popen):
+        """Test that the latest timestamp per file comes from one git call."""
+        readme = sample_git_repo / "README.md"
+        app = sample_git_repo / "src" / "app.py"
+        untracked = sample_git_repo / "untracked.py"
+
+        git_popen.return_value = _mock_process(
+            b"2024-03-01 09:00:00 +0000 c2\nsrc/app.py\0\0"
+            b"2024-01-01 09:00:00 +0000 c1\nREADME.md\0src/app.py\0"
+        )
+        result = get_file_git_timestamps([readme, app, untracked], sample_git_repo)
+
+        assert git_popen.call_count == 1
+        args = git_popen.call_args.args[0]
+        assert args[args.index("--") + 1 :] == [
+            "README.md",
+            "src/app.py",
+            "untracked.py",
+        ]
+        assert result == {
+            app: "2024-03-01 09:00:00",
+            readme: "2024-01-01 09:00:00",
+        }
+
+    def test_get_timestamps_rechecks_files_found_past_a_merge(
+        self, sample_git_repo, git_popen, git_runner
+    ):
+        """Test that files first seen after a merge are looked up on their own."""
+        readme = sample_git_repo / "README.md"
+        app = sample_git_repo / "src" / "app.py"
+        git_popen.return_value = _mock_process(
+            b"2024-04-01 09:00:00 +0000 c3\nsrc/app.py\0\0"
+            b"2024-03-01 09:00:00 +0000 c1 c2\0"  # A merge commit lists no files
+            b"2024-02-01 09:00:00 +0000 c0\nREADME.md\0"
+        )
+        git_runner.return_value = Mock(stdout="2024-01-01 09:00:00 +0000")
+
+        result = get_file_git_timestamps([readme, app], sample_git_repo)
+
+        assert result == {
+            app: "2024-04-01 09:00:00",
+            readme: "2024-01-01 09:00:00",
+        }
+        # Only the file found past the merge needed its own git log
+        args = git_runner.call_args.args[0]
+        assert git_runner.call_count == 1
+        assert args[args.index("--") + 1 :] == ["README.md"]
+
+    def test_get_timestamps_agree_with_single_lookups_across_merges(self, temp_dir):
+        """Test that a change discarded by a merge does not date a file."""
+        repo = temp_dir
+
+        def git(*args, date=None):
+            env = dict(os.environ)
+            if date:
+                env.update(GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date)
+            subprocess.run(
+                [
+                    "git",
+                    "-c",
+                    "user.name=Test User",
+                    "-c",
+                    "user.email=test@example.com",
+                    *args,
+                ],
+                cwd=repo,
+                env=env,
+                check=True,
+                capture_output=True,
+            )
+
+        def commit(message, date, **contents):
+            for name, text in contents.items():
+                (repo / name).write_text(text)
+            git("add", "-A")
+            git("commit", "-m", message, date=date)
+
+        git("init")
+        commit("Base", "2020-01-01T12:00:00", a="base\n", b="base\n")
+        git("checkout", "-b", "side")
+        commit("Side", "2020-03-01T12:00:00", a="side\n", b="side\n")
+        git("checkout", "-")
+        commit("Main", "2020-02-01T12:00:00", a="main\n")
+        # Keep main's a and take side's b, so the merge matches neither parent
+        git("merge", "-X", "ours", "--no-edit", "side", date="2020-04-01T12:00:00")
+
+        a_file, b_file = repo / "a", repo / "b"
+        result = get_file_git_timestamps([a_file, b_file], repo)
+
+        assert result[a_file].startswith("2020-02-01")
+        assert result[b_file].startswith("2020-03-01")
+        assert result == {
+            a_file: get_file_git_timestamp(a_file, repo),
+            b_file: get_file_git_timestamp(b_file, repo),
+        }
+
+    def test_get_timestamps_stops_git_once_all_found(self, sample_git_repo, git_popen):
+        """Test that git is not left walking history after every file is found."""
+        readme = sample_git_repo / "README.md"
+        process = _mock_process(
+            b"2024-03-01 09:00:00 +0000\nREADME.md\0\0"
+            b"2024-02-01 09:00:00 +0000\nREADME.md\0"
+        )
+        process.poll.return_value = None  # Still running
+        git_popen.return_value = process
+
+        result = get_file_git_timestamps([readme], sample_git_repo)
+
+        assert result == {readme: "2024-03-01 09:00:00"}
+        process.kill.assert_called_once()
+        process.wait.assert_called_once()
+
+    def test_get_timestamps_batches_pathspecs(
+        self, sample_git_repo, git_popen, monkeypatch
+    ):
+        """Test that long file lists are split across several git calls."""
+        monkeypatch.setattr(git_operations, "_PATHSPEC_BATCH_CHARS", 10)
+        git_popen.side_effect = subprocess.Popen
+        files = [sample_git_repo / "README.md", sample_git_repo / "src" / "app.py"]
+
+        result = get_file_git_timestamps(files, sample_git_repo)
+
+        assert git_popen.call_count == 2
+        assert set(result) == set(files)
+
+    def test_get_timestamps_with_undecodable_name_in_history(
+        self, sample_git_repo_copy
+    ):
+        """Test that a non-UTF-8 file name elsewhere in history is harmless."""
+        repo = sample_git_repo_copy
+        blob = subprocess.run(
+            ["git", "hash-object", "-w", "--stdin"],
+            cwd=repo,
+            input=b"content\n",
+            capture_output=True,
+            check=True,
+        ).stdout.strip()
+        # Add the entry straight to the index, since not every filesystem
+        # accepts such a name
+        subprocess.run(
+            ["git", "update-index", "--index-info"],
+            cwd=repo,
+            input=b"100644 blob " + blob + b"\tcaf\xe9.txt\n",
+            check=True,
+        )
+        (repo / "README.md").write_text("# Changed\n")
+        subprocess.run(["git", "add", "README.md"], cwd=repo, check=True)
+        subprocess.run(
+            [
+                "git",
+                "-c",
+                "user.name=Test User",
+                "-c",
+                "user.email=test@example.com",
+                "commit",
+                "-m",
+                "Add a Latin-1 file name",
+            ],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+        readme = repo / "README.md"
+        app = repo / "src" / "app.py"
+        result = get_file_git_timestamps([readme, app], repo)
+
+        assert set(result) == {readme, app}
+        assert get_file_git_timestamp(readme, repo) == result[readme]
+
+    def test_get_timestamps_skips_files_outside_root(self, sample_git_repo, temp_dir):
+        """Test that files outside the repository root are ignored."""
+        outside = temp_dir.parent / "elsewhere.py"
+        result = get_file_git_timestamps([outside], sample_git_repo)
+        assert result == {}
+
+    def test_get_timestamps_git_command_failure(self, sample_git_repo, git_popen):
+        """Test handling git command failures in batched lookup."""
+        git_popen.return_value = _mock_process(b"", returncode=128)
+        result = get_file_git_timestamps(
+            [sample_git_repo / "README.md"], sample_git_repo
+        )
+        assert result == {}
+
+    def test_get_timestamps_git_not_found(self, sample_git_repo, git_popen):
+        """Test handling when git is not installed in batched lookup."""
+        git_popen.side_effect = FileNotFoundError("git not found")
+        result = get_file_git_timestamps(
+            [sample_git_repo / "README.md"], sample_git_repo
+        )
+        assert result == {}
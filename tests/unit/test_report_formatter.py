@@ -0,0 +1,26 @@
+import re
+
+from contextr.formatters.report_formatter import RepositoryReportFormatter
+
+
+class TestGenerateReport:
+    """Test the generate_report method."""
+
+    def test_summary_line_counts_agree_for_truncated_file(self, temp_dir):
+        """Test that a truncated file's lines match between total and largest file."""
+        big_file = temp_dir / "big.txt"
+        # ~26KB, so the report shows only the first MAX_FILE_SIZE bytes
+        big_file.write_bytes(b"line of text\n" * 2000)
+        files = [big_file]
+
+        report = RepositoryReportFormatter().generate_report(
+            temp_dir, None, files, [], files
+        )
+
+        total_lines = int(re.search(r"- Total lines: (\d+)", report).group(1))
+        largest_lines = int(
+            re.search(r"- Largest file: big\.txt \((\d+) lines\)", report).group(1)
+        )
+        assert "File truncated" in report
+        assert largest_lines == total_lines
+        assert total_lines < 2000
@@ -1,6 +1,14 @@
 from contextr.output.tree_formatter import _format_tree, generate_tree_structure
 
 
+def _assert_in_order(result, *names):
+    """Assert that names appear in result in the given order, in one scan."""
+    pos = 0
+    for name in names:
+        # index() raises if name is missing or only appears before pos
+        pos = result.index(name, pos) + len(name)
+
+
 class TestGenerateTreeStructure:
     """Tests for generate_tree_structure function."""
 
@@ -66,6 +74,16 @@ class TestGenerateTreeStructure:
         assert "├──" in result or "└──" in result
         assert "src/" in result  # Directories have trailing slash
 
+    def test_root_matching_uses_whole_path_components(self, temp_dir):
+        """Test that only files inside root are kept, and root itself is ignored."""
+        root = temp_dir / "proj"
+        sibling_file = temp_dir / "project" / "sibling.py"  # Shares a name prefix
+        inside_file = root / "inside.py"
+
+        result = generate_tree_structure([root, sibling_file, inside_file], root)
+
+        assert result == "└── inside.py"
+
     def test_sorting_and_filtering(self, temp_dir):
         """Test file sorting and filtering of files outside root."""
         # Files outside root are skipped
@@ -88,12 +106,7 @@ class TestGenerateTreeStructure:
         for f in [file_c, file_a, file_b]:
             f.write_text("content", encoding="utf-8")
         result = generate_tree_structure([file_c, file_a, file_b], temp_dir)
-        pos_a, pos_b, pos_c = (
-            result.find("a_file.py"),
-            result.find("b_file.py"),
-            result.find("c_file.py"),
-        )
-        assert pos_a < pos_b < pos_c
+        _assert_in_order(result, "a_file.py", "b_file.py", "c_file.py")
 
     def test_complex_realistic_structures(self, temp_dir):
         """Test complex realistic project structures with mixed files and directories."""
@@ -194,21 +207,12 @@ class TestFormatTree:
         tree = {"zfile.py": None, "adir": {"nested.py": None}, "bfile.py": None}
         result = _format_tree(tree)
         # Expected order: files first (bfile.py, zfile.py), then directories (adir/)
-        assert result.index("bfile.py") < result.index("adir/")
-        assert result.index("zfile.py") < result.index("adir/")
-        assert result.index("bfile.py") < result.index(
-            "zfile.py"
-        )  # Files are alphabetically sorted
+        _assert_in_order(result, "bfile.py", "zfile.py", "adir/")
 
         # Alphabetical sorting within type
         tree = {"zebra.py": None, "alpha.py": None, "beta.py": None}
         result = _format_tree(tree)
-        pos_alpha, pos_beta, pos_zebra = (
-            result.find("alpha.py"),
-            result.find("beta.py"),
-            result.find("zebra.py"),
-        )
-        assert pos_alpha < pos_beta < pos_zebra
+        _assert_in_order(result, "alpha.py", "beta.py", "zebra.py")
 
     def test_complex_and_mixed_structures(self):
         """Test complex realistic trees, prefix parameter, and mixed nesting."""